@@ -1,8 +1,10 @@
+from optimization.backtracking.backtracking import Backtracking
 from optimization.local_search.meta_heuristics.hill_climbing import HillClimbing
 from optimization.local_search.meta_heuristics.simulated_annealing import (
     SimulatedAnnealing,
 )
-from problems.scheduling.instance import LocalSearchInstance
+from optimization.rng import BufferedRNG
+from problems.scheduling.instance import BacktrackingInstance, LocalSearchInstance
 
 # Task scheduling
 # Given a set of tasks with fixed durations and a set of workers with limited capacity, the optimization goal is to
@@ -12,15 +14,18 @@ task_durations = [1, 2, 3, 4, 4, 6, 7, 4, 4, 3, 6, 9]
 num_workers = 10
 max_load = 9
 
+# A fixed seed makes the runs reproducible. spawn(...) hands every component its own independent stream.
+instance_rng, hill_climbing_rng, annealing_rng = BufferedRNG(seed=42).spawn(3)
+
 instance_for_simulated_annealing = LocalSearchInstance(
-    task_durations, num_workers, max_load, meta_heuristic="Simulated Annealing"
+    task_durations, num_workers, max_load, meta_heuristic="Simulated Annealing", rng=instance_rng
 )
 instance_for_hill_climbing = LocalSearchInstance(
-    task_durations, num_workers, max_load, meta_heuristic="Hill Climbing"
+    task_durations, num_workers, max_load, meta_heuristic="Hill Climbing", rng=hill_climbing_rng
 )
 initial_solution = instance_for_simulated_annealing.generate_feasible_solution()
 
-simulated_annealing = SimulatedAnnealing(instance_for_simulated_annealing, steps=100, temperature=1e6)
+simulated_annealing = SimulatedAnnealing(instance_for_simulated_annealing, steps=100, temperature=1e6, rng=annealing_rng)
 hill_climbing = HillClimbing(instance_for_simulated_annealing, steps=100)
 
 sol_simulated_annealing = simulated_annealing.search(initial_solution)
@@ -34,3 +39,23 @@ score_init = instance_for_simulated_annealing.obj([initial_solution])
 print(f"Simulated Annealing: {sol_simulated_annealing.solution}\n{score_init[0]:.2f} -> {score_simulated_annealing[0]:.2f} +{abs(score_initial[0]-score_simulated_annealing[0]):.2f}")
 print("\n")
 print(f"Hill Climbing: {sol_hill_climbing.solution}\n{score_init[0]:.2f} -> {score_hill_climbing[0]:.2f}  +{abs(score_initial[0]-score_hill_climbing[0]):.2f}")
+
+# Branch and bound proves the optimum of the objective above, which the heuristics can be compared against.
+# It minimizes the cost 1e6 - obj and starts from the hill climbing result if it overloads no worker.
+instance_for_branch_and_bound = BacktrackingInstance(task_durations, num_workers, max_load)
+branch_and_bound = Backtracking(
+    instance_for_branch_and_bound,
+    vars=instance_for_branch_and_bound.variables,
+    steps=100_000,
+    optimize=True,
+    incumbent=(
+        sol_hill_climbing
+        if instance_for_branch_and_bound.is_feasible_sol(sol_hill_climbing)
+        else None
+    ),
+)
+sol_branch_and_bound = branch_and_bound.search()
+score_branch_and_bound = instance_for_simulated_annealing.obj([sol_branch_and_bound])
+
+print("\n")
+print(f"Branch and Bound: {sol_branch_and_bound.solution}\n{score_branch_and_bound[0]:.2f} (proven optimal: {branch_and_bound.proven_optimal})")
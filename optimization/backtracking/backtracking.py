@@ -1,8 +1,15 @@
 from collections import defaultdict
 from copy import deepcopy
+import math
 from typing import Any
 from optimization.backtracking.instance_backtracking import ProblemInstanceBacktracking
-from optimization.exceptions import ErrorDuringStep, ErrorNoImprovement, ErrorNoVars
+from optimization.backtracking.nogood_store import NogoodStore
+from optimization.exceptions import (
+    ErrorDuringStep,
+    ErrorNoImprovement,
+    ErrorNoVars,
+    ErrorStepLimit,
+)
 from optimization.solution import ProblemSolution
 
 
@@ -14,18 +21,57 @@ Value = Any
 
 
 class Backtracking:
+    """
+    Backtracking search over the variables of a ProblemInstanceBacktracking.
+    By default the search stops at the first feasible assignment. With optimize=True it runs as
+    branch and bound: complete assignments update the incumbent, and partial assignments whose
+    lower bound is not better than the incumbent are cut off. A feasible incumbent, e.g. from a
+    heuristic, can be passed to start with a tight bound.
+    With backjumping=True a failing variable jumps back directly to the deepest variable in its
+    conflict set instead of one level up, and the conflicting partial assignment is learned as
+    a nogood, which is checked before every assignment. This needs the instance to implement
+    conflict_set and is only supported without optimize.
+    """
+
     _instance: ProblemInstanceBacktracking
     _steps: int
     _curr_step: int = 0
+    _optimize: bool
+    _backjumping: bool
+    _nogoods: NogoodStore
 
     _vars: set[Variable]
 
+    best_solution: ProblemSolution | None = None
+    best_cost: float = math.inf
+    proven_optimal: bool = False
+
     def __init__(
-        self, instance: ProblemInstanceBacktracking, vars: set, steps: int = 500
+        self,
+        instance: ProblemInstanceBacktracking,
+        vars: set,
+        steps: int = 500,
+        optimize: bool = False,
+        incumbent: ProblemSolution | None = None,
+        backjumping: bool = False,
+        max_nogoods: int = 10_000,
     ):
+        if optimize and backjumping:
+            raise ValueError("Backjumping is only supported without optimize")
+        if backjumping and not instance.supports_backjumping():
+            raise ValueError(f"{type(instance).__name__} doesn't support backjumping")
+
         self._instance = instance
         self._steps = steps
         self._vars = vars
+        self._optimize = optimize
+        self._backjumping = backjumping
+        self._nogoods = NogoodStore(max_size=max_nogoods)
+
+        if incumbent is not None:
+            if not self._instance.is_feasible_sol(incumbent):
+                raise ValueError(f"Incumbent {incumbent} is not a feasible solution")
+            self._update_incumbent(incumbent)
 
         self._set_up()
 
@@ -35,11 +81,29 @@ class Backtracking:
         self._available_vals_at_level: dict[int, set[Value]] = {}
         self._assigned_val_at_level: dict[int, tuple[Variable, Value]] = {}
         self._solution_at_level: dict[int, ProblemSolution] = {}
+        self._level_of_var: dict[int, int] = {}
+        self._conflicts: defaultdict[int, set[Variable]] = defaultdict(set)
 
     def get_current_info(self, **kwargs):
+        if self._optimize:
+            return f"{self._curr_step} / {self._steps}\nbest cost: {self.best_cost:.3f}\n\n"
         return f"{self._curr_step} / {self._steps}\n\n"
 
+    def _update_incumbent(self, solution: ProblemSolution) -> None:
+        cost = self._instance.cost(solution)
+        if cost < self.best_cost:
+            self.best_cost = cost
+            self.best_solution = deepcopy(solution)
+
+    def _is_assigned(self, var: Variable, val: Value) -> bool:
+        level = self._level_of_var.get(hash(var))
+        return level is not None and self._assigned_val_at_level[level][1] == val
+
     def search(self, start_sol: ProblemSolution | None = None) -> ProblemSolution:
+        """
+        Searches until the step limit is reached. When optimizing, returns the best solution found
+        and raises ErrorStepLimit if the step limit is reached before any solution was found.
+        """
         s = (
             start_sol
             if start_sol and self._instance.is_feasible_sol(start_sol)
@@ -52,8 +116,14 @@ class Backtracking:
             try:
                 s = self.step(curr_sol=s)
             except ErrorNoImprovement:
-                return s
+                break
 
+        if self._optimize:
+            if self.best_solution is None:
+                raise ErrorStepLimit(
+                    f"No solution found within the step limit of {self._steps}"
+                )
+            return self.best_solution
         return s
 
     def step(self, curr_sol: ProblemSolution) -> ProblemSolution:
@@ -61,7 +131,16 @@ class Backtracking:
         Performs one step of backtracking search.
         The step can either be an assignment of a value to a variable or a backtracking step.
         Takes empty solution as first curr_sol.
+        When optimizing, a step can also record a complete solution as incumbent or cut off
+        a partial solution by its lower bound, both followed by backtracking.
         """
+        if self._optimize:
+            if not self._vars:
+                self._update_incumbent(curr_sol)
+                return self._backtrack()
+            if self._instance.lower_bound(curr_sol) >= self.best_cost:
+                return self._backtrack()
+
         if not self._vars:
             self._pruned_vals = defaultdict(set)
             self._set_up()
@@ -74,12 +153,29 @@ class Backtracking:
             solution=curr_sol,
             pruned_vals=self._pruned_vals[hash(variable)],
         ):
+            if self._backjumping:
+                nogood = self._nogoods.find(
+                    var=variable, val=value, is_assigned=self._is_assigned
+                )
+                if nogood is not None:
+                    self._conflicts[hash(variable)].update(
+                        var for var, _ in nogood if var != variable
+                    )
+                    continue
+
             if not self._instance.is_feasible_value(
                 val=value, var=variable, solution=curr_sol
             ):
+                if self._backjumping:
+                    self._conflicts[hash(variable)].update(
+                        self._instance.conflict_set(
+                            val=value, var=variable, solution=curr_sol
+                        )
+                    )
                 continue
 
             self._assigned_val_at_level[self._level] = (variable, value)
+            self._level_of_var[hash(variable)] = self._level
             self._vars.remove(variable)
             self._pruned_vals[hash(variable)].add(value)
 
@@ -93,8 +189,18 @@ class Backtracking:
 
             return solution
 
+        if self._backjumping:
+            return self._backjump(variable)
+        return self._backtrack()
+
+    def _backtrack(self) -> ProblemSolution:
         if self._level == 0:
             self._set_up()
+            if self._optimize and self.best_solution is not None:
+                self.proven_optimal = True
+                raise ErrorNoImprovement(
+                    "Search space exhausted, best solution is optimal"
+                )
             raise ErrorCantFindSolution("Can't find a solution.")
 
         #### Backtrack
@@ -104,9 +210,57 @@ class Backtracking:
         # remove assigned value from domain
         previous_var, previous_val = self._assigned_val_at_level[self._level]
         self._pruned_vals[hash(previous_var)].add(previous_val)
-        self._pruned_vals[hash(variable)].clear()
+        del self._level_of_var[hash(previous_var)]
+        # values tried below this level are only pruned for the abandoned subtree
+        for var in self._vars:
+            self._pruned_vals.pop(hash(var), None)
         self._vars.add(previous_var)
 
         # return solution one level above
         self._curr_step += 1
         return self._solution_at_level[self._level]
+
+    def _backjump(self, variable: Variable) -> ProblemSolution:
+        """
+        Jumps back to the deepest assigned variable in the conflict set of the failing variable.
+        The conflict set is learned as nogood and handed on to the variable jumped back to.
+        """
+        conflict = {
+            var
+            for var in self._conflicts.pop(hash(variable), set())
+            if hash(var) in self._level_of_var
+        }
+
+        if not conflict:
+            # the failure doesn't depend on any assignment, so no solution exists
+            self._set_up()
+            raise ErrorCantFindSolution("Can't find a solution.")
+
+        self._nogoods.add(
+            frozenset(
+                (var, self._assigned_val_at_level[self._level_of_var[hash(var)]][1])
+                for var in conflict
+            )
+        )
+
+        target_level = max(self._level_of_var[hash(var)] for var in conflict)
+        culprit, culprit_val = self._assigned_val_at_level[target_level]
+
+        # unassign every variable from the current level up to the culprit
+        for level in range(self._level - 1, target_level - 1, -1):
+            var, _ = self._assigned_val_at_level[level]
+            del self._level_of_var[hash(var)]
+            self._vars.add(var)
+
+        # state of the skipped levels only belonged to the abandoned subtree
+        for var in self._vars:
+            if var != culprit:
+                self._pruned_vals.pop(hash(var), None)
+                self._conflicts.pop(hash(var), None)
+
+        self._pruned_vals[hash(culprit)].add(culprit_val)
+        self._conflicts[hash(culprit)].update(conflict - {culprit})
+
+        self._level = target_level
+        self._curr_step += 1
+        return self._solution_at_level[self._level]
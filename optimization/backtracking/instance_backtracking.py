@@ -36,3 +36,32 @@ class ProblemInstanceBacktracking(ProblemInstance):
         Chooses the next variable. Variable must be hashable.
         """
         raise NotImplementedError
+
+    def cost(self, solution: ProblemSolution) -> float:
+        """
+        Returns the cost of a complete solution, lower is better.
+        Only needed when backtracking is run as branch and bound.
+        """
+        raise NotImplementedError
+
+    def lower_bound(self, solution: ProblemSolution) -> float:
+        """
+        Returns a lower bound on the cost of every complete solution extending the partial solution.
+        Only needed when backtracking is run as branch and bound.
+        """
+        raise NotImplementedError
+
+    def conflict_set(self, val: Any, var: Any, solution: ProblemSolution) -> set[Any]:
+        """
+        Returns the assigned variables responsible for the value being infeasible for the variable.
+        Only needed when backtracking is run with backjumping.
+        """
+        raise NotImplementedError
+
+    def supports_backjumping(self) -> bool:
+        """
+        Tells whether conflict sets explain every failure. By default this holds if conflict_set is
+        implemented. Instances whose get_values prunes values based on the partial solution must
+        return False, since those values have no conflict set.
+        """
+        return type(self).conflict_set is not ProblemInstanceBacktracking.conflict_set
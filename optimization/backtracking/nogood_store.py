@@ -0,0 +1,59 @@
+from collections import OrderedDict, defaultdict
+from typing import Any, Callable
+
+Nogood = frozenset[tuple[Any, Any]]
+
+
+class NogoodStore:
+    """
+    Bounded store of learned nogoods, i.e. sets of (variable, value) pairs that can't all hold in a solution.
+    Nogoods are hashed and indexed by each of their pairs, so only nogoods containing a new assignment are checked.
+    Once max_size is reached the least recently used nogood is evicted.
+    """
+
+    _max_size: int
+    _nogoods: OrderedDict[Nogood, None]
+    _index: defaultdict[tuple[Any, Any], set[Nogood]]
+
+    def __init__(self, max_size: int = 10_000) -> None:
+        if max_size < 1:
+            raise ValueError(f"max_size must be positive, got {max_size}")
+        self._max_size = max_size
+        self._nogoods = OrderedDict()
+        self._index = defaultdict(set)
+
+    def __len__(self) -> int:
+        return len(self._nogoods)
+
+    def add(self, nogood: Nogood) -> None:
+        if nogood in self._nogoods:
+            self._nogoods.move_to_end(nogood)
+            return
+
+        if len(self._nogoods) >= self._max_size:
+            evicted, _ = self._nogoods.popitem(last=False)
+            for pair in evicted:
+                self._index[pair].discard(evicted)
+                if not self._index[pair]:
+                    del self._index[pair]
+
+        self._nogoods[nogood] = None
+        for pair in nogood:
+            self._index[pair].add(nogood)
+
+    def find(
+        self, var: Any, val: Any, is_assigned: Callable[[Any, Any], bool]
+    ) -> Nogood | None:
+        """
+        Returns a nogood violated by assigning val to var, given the current assignment.
+        is_assigned(var, val) tells whether var currently has value val.
+        """
+        for nogood in self._index.get((var, val), ()):
+            if all(
+                is_assigned(other_var, other_val)
+                for other_var, other_val in nogood
+                if other_var != var
+            ):
+                self._nogoods.move_to_end(nogood)
+                return nogood
+        return None
@@ -8,13 +8,15 @@ from optimization.exceptions import (
     ErrorStepLimit,
 )
 from optimization.local_search.instance_local_search import ProblemInstanceLocalSearch
+from optimization.rng import BufferedRNG, RNGLike, make_rng
 from optimization.solution import ProblemSolution
 
 
 class LocalSearch(ABC):
     """
     A protocol for local search algorithms. The local search class takes a problem instance,
-    and an amount of steps.
+    and an amount of steps. Stochastic decisions draw from rng, which accepts a seed,
+    a numpy Generator or a BufferedRNG.
     """
 
     _instance: ProblemInstanceLocalSearch
@@ -22,16 +24,19 @@ class LocalSearch(ABC):
     _curr_step: int = 0
     _tries: int = 0
     _attempts: int
+    _rng: BufferedRNG
 
     def __init__(
         self,
         instance: ProblemInstanceLocalSearch,
         steps: int,
         attempts: int = 100,
+        rng: RNGLike = None,
     ) -> None:
         self._instance = instance
         self._steps = steps
         self._attempts = attempts
+        self._rng = make_rng(rng)
 
     @abstractmethod
     def _choose(self, obj_diffs: np.ndarray) -> list[int]:
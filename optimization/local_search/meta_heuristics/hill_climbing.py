@@ -2,6 +2,7 @@
 
 import numpy as np
 from optimization.local_search.local_search import LocalSearch
+from optimization.rng import RNGLike
 
 
 class HillClimbing(LocalSearch):
@@ -12,8 +13,8 @@ class HillClimbing(LocalSearch):
 
     _method = "exhaustive"
 
-    def __init__(self, instance, steps, attempts: int = 100):
-        super().__init__(instance, steps, attempts)
+    def __init__(self, instance, steps, attempts: int = 100, rng: RNGLike = None):
+        super().__init__(instance, steps, attempts, rng)
 
     def _choose(self, obj_diffs: np.ndarray) -> list[int]:
         argmax = np.argmax(obj_diffs).astype(int)
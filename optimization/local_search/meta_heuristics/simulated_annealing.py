@@ -1,6 +1,7 @@
 from enum import StrEnum
 import numpy as np
 from optimization.local_search.local_search import LocalSearch
+from optimization.rng import RNGLike
 
 
 class CoolingSchedule(StrEnum):
@@ -24,8 +25,9 @@ class SimulatedAnnealing(LocalSearch):
         alpha: float = 0.99,
         C: float = 50.0,
         cooling_schedule: CoolingSchedule = CoolingSchedule.GEOMETRIC,
+        rng: RNGLike = None,
     ):
-        super().__init__(instance, steps)
+        super().__init__(instance, steps, rng=rng)
         self.alpha = alpha
         self.C = C
         self._T = temperature
@@ -44,9 +46,7 @@ class SimulatedAnnealing(LocalSearch):
                 self._T = self._log_cooling(step=self._curr_step, C=self.C)
 
         return (
-            [0]
-            if np.random.uniform(0, 1) < np.exp(obj_diffs[0] / (self._T + 1e-2))
-            else []
+            [0] if self._rng.uniform() < np.exp(obj_diffs[0] / (self._T + 1e-2)) else []
         )
 
     @staticmethod
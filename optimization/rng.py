@@ -0,0 +1,92 @@
+"""Seedable, block-buffered random number generation shared by all stochastic components."""
+
+import numpy as np
+
+
+class BufferedRNG:
+    """
+    Wraps a numpy Generator and hands out random numbers from a pre-drawn block.
+    Uniforms are drawn block_size at a time and the block is refilled once it is used up,
+    so hot loops take a number from a list instead of calling the generator per proposal.
+    Random integers are derived from the same uniform block.
+    """
+
+    _generator: np.random.Generator
+    _block_size: int
+    _uniforms: list[float]
+    _pos: int
+
+    def __init__(
+        self,
+        seed: int | np.random.SeedSequence | np.random.Generator | None = None,
+        block_size: int = 4096,
+    ) -> None:
+        if block_size < 1:
+            raise ValueError(f"block_size must be positive, got {block_size}")
+        self._generator = (
+            seed
+            if isinstance(seed, np.random.Generator)
+            else np.random.default_rng(seed)
+        )
+        self._block_size = block_size
+        self._uniforms = []
+        self._pos = 0
+
+    @property
+    def generator(self) -> np.random.Generator:
+        return self._generator
+
+    def _refill(self) -> None:
+        self._uniforms = self._generator.random(self._block_size).tolist()
+        self._pos = 0
+
+    def uniform(self) -> float:
+        """Returns a uniform float in [0, 1)."""
+        if self._pos >= len(self._uniforms):
+            self._refill()
+        u = self._uniforms[self._pos]
+        self._pos += 1
+        return u
+
+    def integer(self, high: int) -> int:
+        """Returns a uniform integer in [0, high)."""
+        if high < 1:
+            raise ValueError(f"high must be positive, got {high}")
+        return min(int(self.uniform() * high), high - 1)
+
+    def integers(self, high: int, size: int) -> list[int]:
+        """Returns size uniform integers in [0, high)."""
+        return [self.integer(high) for _ in range(size)]
+
+    def sample(self, n: int, k: int) -> list[int]:
+        """
+        Returns k distinct integers from [0, n) using Floyd's algorithm,
+        which needs exactly k draws regardless of n.
+        """
+        if not 0 <= k <= n:
+            raise ValueError(f"Sample size {k} is larger than population {n}")
+        selected: list[int] = []
+        for j in range(n - k, n):
+            t = self.integer(j + 1)
+            selected.append(j if t in selected else t)
+        return selected
+
+    def spawn(self, n: int) -> list["BufferedRNG"]:
+        """Returns n statistically independent child streams, e.g. for parallel workers."""
+        return [
+            BufferedRNG(child, block_size=self._block_size)
+            for child in self._generator.spawn(n)
+        ]
+
+
+RNGLike = int | np.random.SeedSequence | np.random.Generator | BufferedRNG | None
+
+
+def make_rng(rng: RNGLike = None) -> BufferedRNG:
+    """
+    Turns a seed, a numpy Generator or an existing BufferedRNG into a BufferedRNG.
+    An existing BufferedRNG is returned as is, so components handed the same object share one stream.
+    """
+    if isinstance(rng, BufferedRNG):
+        return rng
+    return BufferedRNG(rng)
@@ -1,7 +1,9 @@
 from ctypes import ArgumentError
-import random
+import math
 from typing import Literal
+from optimization.backtracking.instance_backtracking import ProblemInstanceBacktracking
 from optimization.local_search.instance_local_search import ProblemInstanceLocalSearch
+from optimization.rng import RNGLike, make_rng
 from optimization.solution import ProblemSolution
 from problems.scheduling.neighborhood import (
     HillClimbingNeighborhood,
@@ -22,10 +24,12 @@ class LocalSearchInstance(ProblemInstanceLocalSearch):
         num_workers: int,
         max_worker_load: int,
         meta_heuristic: Literal["Hill Climbing", "Simulated Annealing"],
+        rng: RNGLike = None,
     ) -> None:
         self.task_durations = task_durations
         self.num_workers = num_workers
         self.max_worker_load = max_worker_load
+        self._rng = make_rng(rng)
 
         match meta_heuristic:
             case "Hill Climbing":
@@ -34,6 +38,7 @@ class LocalSearchInstance(ProblemInstanceLocalSearch):
                     task_durations=task_durations,
                     max_worker_load=max_worker_load,
                     filter_feasible=True,
+                    rng=self._rng,
                 )
             case "Simulated Annealing":
                 self.neighborhood = SimulatedAnnealingNeighborhood(
@@ -41,6 +46,7 @@ class LocalSearchInstance(ProblemInstanceLocalSearch):
                     task_durations=task_durations,
                     max_worker_load=max_worker_load,
                     filter_feasible=True,
+                    rng=self._rng,
                 )
             case _:
                 raise ArgumentError(
@@ -62,9 +68,7 @@ class LocalSearchInstance(ProblemInstanceLocalSearch):
         max_attempts = 1000
         num_tasks = len(self.task_durations)
         for _ in range(max_attempts):
-            candidate = [
-                random.randint(0, self.num_workers - 1) for _ in range(num_tasks)
-            ]
+            candidate = self._rng.integers(self.num_workers, num_tasks)
             if self.is_feasible_sol(ScheduleSolution(candidate)):
                 return ScheduleSolution(candidate)
         raise ErrorWhileGeneratingSolution("Exceeded max attempts")
@@ -78,3 +82,170 @@ class LocalSearchInstance(ProblemInstanceLocalSearch):
         for task_idx, worker_id in enumerate(assignment):
             loads[worker_id] += self.task_durations[task_idx]
         return all(load <= self.max_worker_load for load in loads)
+
+
+class BacktrackingInstance(ProblemInstanceBacktracking):
+    """
+    Task scheduling for (branch and bound) backtracking. Variables are task indices, values are workers.
+    The cost is 1e6 minus LoadBalancingObjective.obj, i.e. the load variance plus the weighted
+    overload penalty, where like there only workers up to the highest used worker id count.
+    With allow_overload=False worker capacity is a hard constraint, otherwise it is only penalized.
+    Symmetry breaking prunes values without a conflict set, so backjumping needs
+    break_symmetries=False.
+    """
+
+    overload_weight: float = 10.0
+
+    def __init__(
+        self,
+        task_durations: list[int],
+        num_workers: int,
+        max_worker_load: int,
+        allow_overload: bool = False,
+        break_symmetries: bool = True,
+    ) -> None:
+        self.task_durations = task_durations
+        self.num_workers = num_workers
+        self.max_worker_load = max_worker_load
+        self.allow_overload = allow_overload
+        self.break_symmetries = break_symmetries
+
+        self._total_load = sum(task_durations)
+        # tasks by decreasing duration, long tasks constrain the loads the most
+        self._task_order = sorted(
+            range(len(task_durations)), key=lambda task: -task_durations[task]
+        )
+
+    @property
+    def variables(self) -> set[int]:
+        return set(range(len(self.task_durations)))
+
+    def _generate_feasible_solution(self) -> ProblemSolution:
+        """Returns the empty assignment backtracking starts from."""
+        return ScheduleSolution([None for _ in self.task_durations])
+
+    def _worker_loads(self, assignment: list[int | None]) -> list[int]:
+        loads = [0 for _ in range(self.num_workers)]
+        for task_idx, worker_id in enumerate(assignment):
+            if worker_id is not None:
+                loads[worker_id] += self.task_durations[task_idx]
+        return loads
+
+    def _load_cost(self, load: float, num_counted: int) -> float:
+        """Contribution of a single worker load to the cost when num_counted workers count."""
+        overload = max(0.0, load - self.max_worker_load)
+        mean = self._total_load / num_counted
+        return (load - mean) ** 2 / num_counted + self.overload_weight * overload**2
+
+    @staticmethod
+    def _used_workers(assignment: list[int | None]) -> int:
+        """Number of workers up to the highest used worker id."""
+        return max((w for w in assignment if w is not None), default=-1) + 1
+
+    def is_feasible_sol(self, solution: ProblemSolution) -> bool:
+        """A feasible solution assigns every task and, unless allowed, overloads no worker."""
+        assignment = solution.solution
+        if len(assignment) != len(self.task_durations) or None in assignment:
+            return False
+        if self.allow_overload:
+            return True
+        loads = self._worker_loads(solution.solution)
+        return all(load <= self.max_worker_load for load in loads)
+
+    def is_feasible_value(self, val: int, var: int, solution: ProblemSolution) -> bool:
+        if self.allow_overload:
+            return True
+        load = sum(
+            self.task_durations[task_idx]
+            for task_idx, worker_id in enumerate(solution.solution)
+            if worker_id == val
+        )
+        return load + self.task_durations[var] <= self.max_worker_load
+
+    def conflict_set(self, val: int, var: int, solution: ProblemSolution) -> set[int]:
+        """The tasks already assigned to the worker exceed its capacity together with the task."""
+        if not self.supports_backjumping():
+            raise ValueError("Conflict sets are only sound with break_symmetries=False")
+        return {
+            task_idx
+            for task_idx, worker_id in enumerate(solution.solution)
+            if worker_id == val
+        }
+
+    def supports_backjumping(self) -> bool:
+        return super().supports_backjumping() and not self.break_symmetries
+
+    def assign_value(
+        self, val: int, var: int, solution: ProblemSolution
+    ) -> ProblemSolution:
+        assignment = solution.solution[:]
+        assignment[var] = val
+        return ScheduleSolution(assignment)
+
+    def get_values(
+        self, var: int, solution: ProblemSolution, pruned_vals: set[int]
+    ) -> list[int]:
+        """
+        Returns workers by increasing load. Workers up to the highest used worker id all count
+        for the cost, so those with equal load lead to symmetric subtrees and, when breaking
+        symmetries, only the first of them is branched on. Workers above change the number of
+        counted workers and are always branched on.
+        """
+        loads = self._worker_loads(solution.solution)
+        used = self._used_workers(solution.solution)
+        seen_loads = set()
+        values = []
+        for worker in sorted(range(self.num_workers), key=lambda w: loads[w]):
+            if worker < used:
+                if self.break_symmetries and loads[worker] in seen_loads:
+                    continue
+                seen_loads.add(loads[worker])
+            if worker not in pruned_vals:
+                values.append(worker)
+        return values
+
+    def choose_variable(self, vars: set[int], solution: ProblemSolution) -> int:
+        return next(task for task in self._task_order if task in vars)
+
+    def cost(self, solution: ProblemSolution) -> float:
+        assignment = solution.solution
+        num_counted = self._used_workers(assignment)
+        loads = self._worker_loads(assignment)[:num_counted]
+        return sum(self._load_cost(load, num_counted) for load in loads)
+
+    def lower_bound(self, solution: ProblemSolution) -> float:
+        """
+        Bounds the cost for every possible number of counted workers and takes the minimum.
+        """
+        assignment = solution.solution
+        loads = self._worker_loads(assignment)
+        remaining = sum(
+            duration
+            for duration, worker_id in zip(self.task_durations, assignment)
+            if worker_id is None
+        )
+        return min(
+            self._relaxed_cost(loads[:num_counted], remaining)
+            for num_counted in range(
+                max(self._used_workers(assignment), 1), self.num_workers + 1
+            )
+        )
+
+    def _relaxed_cost(self, loads: list[int], remaining: int) -> float:
+        """
+        Relaxes the remaining tasks to work that can be split arbitrarily among the given workers.
+        The cost is convex and the same for every worker, so the relaxation is solved by water
+        filling: the least loaded workers are raised to a common level until the remaining work
+        is used up.
+        """
+        loads = sorted(loads)
+        filled = remaining
+        for k, load in enumerate(loads):
+            filled += load
+            level = filled / (k + 1)
+            if k + 1 == len(loads) or level <= loads[k + 1]:
+                break
+
+        if not self.allow_overload and level > self.max_worker_load:
+            return math.inf
+        return sum(self._load_cost(max(load, level), len(loads)) for load in loads)
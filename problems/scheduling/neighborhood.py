@@ -1,6 +1,6 @@
 from itertools import combinations, product
-import random
 from optimization.local_search.neighborhood import Neighborhood
+from optimization.rng import RNGLike, make_rng
 from optimization.solution import ProblemSolution
 from problems.scheduling.solution import ScheduleSolution
 
@@ -13,12 +13,14 @@ class TaskSchedulingNeighborhood(Neighborhood):
         max_worker_load: int,
         filter_feasible: bool = True,
         max_changes: int = 2,
+        rng: RNGLike = None,
     ):
         self.num_workers = num_workers
         self.task_durations = task_durations
         self.max_worker_load = max_worker_load
         self.filter_feasible = filter_feasible
         self.max_changes = max_changes
+        self._rng = make_rng(rng)
 
     def _is_feasible(self, solution: ProblemSolution) -> bool:
         assignment = solution.solution
@@ -36,9 +38,15 @@ class HillClimbingNeighborhood(TaskSchedulingNeighborhood):
         max_worker_load: int,
         filter_feasible: bool = True,
         max_changes: int = 2,
+        rng: RNGLike = None,
     ):
         super().__init__(
-            num_workers, task_durations, max_worker_load, filter_feasible, max_changes
+            num_workers,
+            task_durations,
+            max_worker_load,
+            filter_feasible,
+            max_changes,
+            rng,
         )
 
     def get_neighbors(self, solution: ProblemSolution) -> list[ProblemSolution]:
@@ -75,9 +83,15 @@ class SimulatedAnnealingNeighborhood(TaskSchedulingNeighborhood):
         filter_feasible: bool = True,
         max_changes: int = 2,
         num_samples: int = 100,
+        rng: RNGLike = None,
     ):
         super().__init__(
-            num_workers, task_durations, max_worker_load, filter_feasible, max_changes
+            num_workers,
+            task_durations,
+            max_worker_load,
+            filter_feasible,
+            max_changes,
+            rng,
         )
         self.num_samples = num_samples
 
@@ -85,20 +99,21 @@ class SimulatedAnnealingNeighborhood(TaskSchedulingNeighborhood):
         assignment = solution.solution
         num_tasks = len(assignment)
         neighbors = []
+        rng = self._rng
 
         for _ in range(self.num_samples):
             new_assignment = assignment[:]
 
-            k = random.randint(1, self.max_changes)
+            k = 1 + rng.integer(self.max_changes)
 
-            tasks_to_change = random.sample(range(num_tasks), k)
+            tasks_to_change = rng.sample(num_tasks, k)
 
             for task_idx in tasks_to_change:
+                # draw from the other num_workers - 1 workers by skipping the current one
                 current_worker = new_assignment[task_idx]
-                possible_workers = [
-                    w for w in range(self.num_workers) if w != current_worker
-                ]
-                new_worker = random.choice(possible_workers)
+                new_worker = rng.integer(self.num_workers - 1)
+                if new_worker >= current_worker:
+                    new_worker += 1
                 new_assignment[task_idx] = new_worker
 
             neighbor = ScheduleSolution(new_assignment)
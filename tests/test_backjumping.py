@@ -0,0 +1,185 @@
+import itertools
+import random
+
+import pytest
+
+from optimization.backtracking.backtracking import Backtracking, ErrorCantFindSolution
+from optimization.backtracking.instance_backtracking import ProblemInstanceBacktracking
+from optimization.backtracking.nogood_store import NogoodStore
+from optimization.exceptions import ErrorNoVars
+from problems.scheduling.instance import BacktrackingInstance
+from problems.scheduling.solution import ScheduleSolution
+
+
+def solve(instance: BacktrackingInstance, **kwargs) -> ScheduleSolution | None:
+    """Steps until every task is assigned, returns None if no solution exists."""
+    backtracking = Backtracking(instance, instance.variables, steps=10**6, **kwargs)
+    solution = instance.generate_feasible_solution()
+    try:
+        while True:
+            solution = backtracking.step(solution)
+    except ErrorNoVars:
+        return solution
+    except ErrorCantFindSolution:
+        return None
+
+
+def is_satisfiable(instance: BacktrackingInstance) -> bool:
+    return any(
+        instance.is_feasible_sol(ScheduleSolution(list(assignment)))
+        for assignment in itertools.product(
+            range(instance.num_workers), repeat=len(instance.task_durations)
+        )
+    )
+
+
+@pytest.mark.parametrize("max_nogoods", [3, 10_000])
+def test_agrees_with_chronological_backtracking(max_nogoods):
+    rng = random.Random(0)
+    for _ in range(500):
+        task_durations = [rng.randint(1, 6) for _ in range(rng.randint(1, 7))]
+        num_workers = rng.randint(1, 4)
+        max_load = rng.randint(
+            max(task_durations),
+            max(task_durations) + sum(task_durations) // num_workers,
+        )
+        args = (task_durations, num_workers, max_load)
+
+        chronological = solve(BacktrackingInstance(*args))
+        instance = BacktrackingInstance(*args, break_symmetries=False)
+        backjumping = solve(instance, backjumping=True, max_nogoods=max_nogoods)
+
+        assert (
+            (chronological is None)
+            == (backjumping is None)
+            == (not is_satisfiable(instance))
+        ), args
+        if backjumping is not None:
+            assert instance.is_feasible_sol(backjumping)
+
+
+def test_finds_solution_of_symmetric_instance():
+    instance = BacktrackingInstance([4, 5, 2, 5, 4], 2, 10, break_symmetries=False)
+
+    solution = solve(instance, backjumping=True)
+
+    assert solution is not None
+    assert instance.is_feasible_sol(solution)
+
+
+def test_symmetry_breaking_rejects_backjumping():
+    instance = BacktrackingInstance([4, 5, 2, 5, 4], 2, 10)
+
+    with pytest.raises(ValueError):
+        Backtracking(instance, instance.variables, backjumping=True)
+    with pytest.raises(ValueError):
+        instance.conflict_set(val=0, var=1, solution=ScheduleSolution([0] + [None] * 4))
+
+
+def test_nogood_store_evicts_least_recently_used():
+    store = NogoodStore(max_size=2)
+    first = frozenset({("a", 0)})
+    second = frozenset({("b", 0)})
+    store.add(first)
+    store.add(second)
+
+    # using the first nogood makes the second one the least recently used
+    assert store.find("a", 0, is_assigned=lambda var, val: False) == first
+    store.add(frozenset({("c", 0)}))
+
+    assert len(store) == 2
+    assert store.find("a", 0, is_assigned=lambda var, val: False) == first
+    assert store.find("b", 0, is_assigned=lambda var, val: False) is None
+
+
+class GraphColoring(ProblemInstanceBacktracking):
+    """Colours the nodes of a graph so that adjacent nodes get different colours."""
+
+    def __init__(self, num_nodes: int, edges: list[tuple[int, int]], num_colors: int):
+        self.num_nodes = num_nodes
+        self.num_colors = num_colors
+        self.neighbors = {node: set() for node in range(num_nodes)}
+        for a, b in edges:
+            self.neighbors[a].add(b)
+            self.neighbors[b].add(a)
+
+    def _generate_feasible_solution(self) -> ScheduleSolution:
+        return ScheduleSolution([None for _ in range(self.num_nodes)])
+
+    def is_feasible_sol(self, solution: ScheduleSolution) -> bool:
+        return True
+
+    def is_feasible_value(self, val: int, var: int, solution: ScheduleSolution) -> bool:
+        return all(solution.solution[other] != val for other in self.neighbors[var])
+
+    def conflict_set(self, val: int, var: int, solution: ScheduleSolution) -> set[int]:
+        return {
+            other for other in self.neighbors[var] if solution.solution[other] == val
+        }
+
+    def assign_value(
+        self, val: int, var: int, solution: ScheduleSolution
+    ) -> ScheduleSolution:
+        assignment = solution.solution[:]
+        assignment[var] = val
+        return ScheduleSolution(assignment)
+
+    def get_values(
+        self, var: int, solution: ScheduleSolution, pruned_vals: set[int]
+    ) -> list[int]:
+        return [color for color in range(self.num_colors) if color not in pruned_vals]
+
+    def choose_variable(self, vars: set[int], solution: ScheduleSolution) -> int:
+        return min(vars)
+
+
+def count_steps(instance: GraphColoring, **kwargs) -> tuple[bool, int]:
+    backtracking = Backtracking(
+        instance, set(range(instance.num_nodes)), steps=10**6, **kwargs
+    )
+    solution = instance.generate_feasible_solution()
+    try:
+        while True:
+            solution = backtracking.step(solution)
+    except ErrorNoVars:
+        return True, backtracking._curr_step
+    except ErrorCantFindSolution:
+        return False, backtracking._curr_step
+
+
+def test_backjumping_skips_unrelated_variables():
+    # a chain of 8 nodes that is easy to colour, followed by a K4 that 3 colours can't colour
+    edges = [(node, node + 1) for node in range(7)]
+    edges += list(itertools.combinations(range(8, 12), 2))
+    instance = GraphColoring(12, edges, 3)
+
+    solved_chronological, steps_chronological = count_steps(instance)
+    solved_backjumping, steps_backjumping = count_steps(instance, backjumping=True)
+
+    assert not solved_chronological and not solved_backjumping
+    assert steps_backjumping * 100 < steps_chronological
+
+
+def test_backjumping_agrees_on_random_graphs():
+    rng = random.Random(2)
+    for _ in range(200):
+        num_nodes = rng.randint(2, 9)
+        edges = [
+            edge
+            for edge in itertools.combinations(range(num_nodes), 2)
+            if rng.random() < 0.4
+        ]
+        instance = GraphColoring(num_nodes, edges, rng.randint(2, 4))
+
+        solved, _ = count_steps(instance)
+        assert count_steps(instance, backjumping=True, max_nogoods=2)[0] == solved
+
+
+def test_instance_without_conflict_sets_rejects_backjumping():
+    class WithoutConflictSets(GraphColoring):
+        conflict_set = ProblemInstanceBacktracking.conflict_set
+
+    instance = WithoutConflictSets(3, [(0, 1)], 2)
+
+    with pytest.raises(ValueError):
+        Backtracking(instance, set(range(3)), backjumping=True)
@@ -0,0 +1,128 @@
+import itertools
+import math
+import random
+
+import pytest
+
+from optimization.backtracking.backtracking import Backtracking, ErrorCantFindSolution
+from optimization.exceptions import ErrorStepLimit
+from problems.scheduling.instance import BacktrackingInstance
+from problems.scheduling.objective import LoadBalancingObjective
+from problems.scheduling.solution import ScheduleSolution
+
+
+def brute_force_cost(instance: BacktrackingInstance) -> float:
+    best = math.inf
+    for assignment in itertools.product(
+        range(instance.num_workers), repeat=len(instance.task_durations)
+    ):
+        solution = ScheduleSolution(list(assignment))
+        if instance.is_feasible_sol(solution):
+            best = min(best, instance.cost(solution))
+    return best
+
+
+def test_matches_brute_force_on_random_instances():
+    rng = random.Random(0)
+    for _ in range(200):
+        task_durations = [rng.randint(1, 6) for _ in range(rng.randint(1, 6))]
+        num_workers = rng.randint(1, 4)
+        max_load = rng.randint(max(task_durations), sum(task_durations))
+        instance = BacktrackingInstance(
+            task_durations, num_workers, max_load, allow_overload=rng.random() < 0.4
+        )
+        expected = brute_force_cost(instance)
+
+        branch_and_bound = Backtracking(
+            instance, instance.variables, steps=10**6, optimize=True
+        )
+        if math.isinf(expected):
+            with pytest.raises(ErrorCantFindSolution):
+                branch_and_bound.search()
+            continue
+
+        solution = branch_and_bound.search()
+        assert branch_and_bound.proven_optimal
+        assert instance.is_feasible_sol(solution)
+        assert instance.cost(solution) == pytest.approx(expected)
+
+
+def test_infeasible_incumbent_is_rejected():
+    instance = BacktrackingInstance([3, 3, 3, 3], 2, 5)
+
+    with pytest.raises(ValueError):
+        Backtracking(
+            instance,
+            instance.variables,
+            optimize=True,
+            incumbent=ScheduleSolution([0, 0, 1, 1]),
+        )
+
+    with pytest.raises(ErrorCantFindSolution):
+        Backtracking(instance, instance.variables, optimize=True).search()
+
+
+def test_partial_incumbent_is_rejected():
+    instance = BacktrackingInstance([3, 3, 3, 3], 2, 6)
+
+    with pytest.raises(ValueError):
+        Backtracking(
+            instance,
+            instance.variables,
+            optimize=True,
+            incumbent=ScheduleSolution([0, 0, None, None]),
+        )
+
+
+def test_feasible_incumbent_is_improved():
+    instance = BacktrackingInstance([4, 3, 3, 2], 2, 8)
+    incumbent = ScheduleSolution([0, 0, 1, 1])
+
+    branch_and_bound = Backtracking(
+        instance, instance.variables, steps=10**4, optimize=True, incumbent=incumbent
+    )
+    solution = branch_and_bound.search()
+
+    assert branch_and_bound.proven_optimal
+    assert instance.cost(solution) == pytest.approx(0.0)
+    assert instance.cost(solution) < instance.cost(incumbent)
+
+
+def test_cost_matches_local_search_objective():
+    rng = random.Random(1)
+    for _ in range(500):
+        task_durations = [rng.randint(1, 6) for _ in range(rng.randint(1, 8))]
+        num_workers = rng.randint(1, 5)
+        instance = BacktrackingInstance(
+            task_durations, num_workers, 7, allow_overload=True
+        )
+        objective = LoadBalancingObjective(task_durations, 7)
+        solution = ScheduleSolution(
+            [rng.randrange(num_workers) for _ in task_durations]
+        )
+
+        assert instance.cost(solution) == pytest.approx(
+            1e6 - objective.obj([solution])[0], abs=1e-6
+        )
+
+
+def test_optimum_is_not_beaten_by_heuristic_solution():
+    task_durations = [1, 2, 3, 4, 4, 6, 7, 4, 4, 3, 6, 9]
+    instance = BacktrackingInstance(task_durations, 10, 9)
+    objective = LoadBalancingObjective(task_durations, 9)
+    heuristic = ScheduleSolution([3, 6, 2, 2, 6, 5, 0, 3, 1, 1, 7, 4])
+
+    branch_and_bound = Backtracking(
+        instance, instance.variables, steps=10**6, optimize=True
+    )
+    solution = branch_and_bound.search()
+
+    assert branch_and_bound.proven_optimal
+    assert objective.obj([solution])[0] >= objective.obj([heuristic])[0]
+
+
+def test_step_limit_without_solution_raises():
+    instance = BacktrackingInstance([1, 2, 3, 4, 5, 6], 3, 7)
+
+    with pytest.raises(ErrorStepLimit):
+        Backtracking(instance, instance.variables, steps=3, optimize=True).search()
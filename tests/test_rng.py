@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+from optimization.rng import BufferedRNG, make_rng
+from problems.scheduling.neighborhood import SimulatedAnnealingNeighborhood
+from problems.scheduling.solution import ScheduleSolution
+
+
+def draw(rng: BufferedRNG) -> list:
+    return (
+        [rng.uniform() for _ in range(10)]
+        + rng.integers(7, 10)
+        + [tuple(rng.sample(9, 3)) for _ in range(10)]
+    )
+
+
+def test_same_seed_gives_same_sequence():
+    # a small block size makes the sequences span several refills
+    assert draw(BufferedRNG(seed=7, block_size=5)) == draw(
+        BufferedRNG(seed=7, block_size=5)
+    )
+    assert draw(BufferedRNG(seed=7)) != draw(BufferedRNG(seed=8))
+
+
+def test_make_rng_shares_existing_stream():
+    rng = BufferedRNG(seed=0)
+    assert make_rng(rng) is rng
+    assert make_rng(3).uniform() == BufferedRNG(np.random.default_rng(3)).uniform()
+
+
+def test_spawned_streams_are_independent():
+    first, second = BufferedRNG(seed=1).spawn(2)
+    first_draws = [first.uniform() for _ in range(1000)]
+    second_draws = [second.uniform() for _ in range(1000)]
+
+    assert first_draws != second_draws
+    assert abs(np.corrcoef(first_draws, second_draws)[0, 1]) < 0.1
+
+    # spawning is reproducible as well
+    again, _ = BufferedRNG(seed=1).spawn(2)
+    assert [again.uniform() for _ in range(1000)] == first_draws
+
+
+def test_integer_stays_in_range():
+    rng = BufferedRNG(seed=2, block_size=64)
+    for high in (1, 2, 3, 10):
+        values = rng.integers(high, 2000)
+        assert min(values) == 0
+        assert max(values) == high - 1
+
+    with pytest.raises(ValueError):
+        rng.integer(0)
+
+
+def test_sample_returns_distinct_values():
+    rng = BufferedRNG(seed=3)
+    for n in range(6):
+        for k in range(n + 1):
+            sample = rng.sample(n, k)
+            assert len(sample) == k
+            assert len(set(sample)) == k
+            assert all(0 <= value < n for value in sample)
+
+    with pytest.raises(ValueError):
+        rng.sample(3, 4)
+
+
+@pytest.mark.parametrize("max_changes", [1, 2])
+def test_simulated_annealing_neighbors_change_workers(max_changes):
+    assignment = [0, 1, 2, 3, 0, 1, 2, 3]
+    neighborhood = SimulatedAnnealingNeighborhood(
+        num_workers=4,
+        task_durations=[1 for _ in assignment],
+        max_worker_load=10,
+        max_changes=max_changes,
+        num_samples=500,
+        rng=4,
+    )
+
+    for neighbor in neighborhood.get_neighbors(ScheduleSolution(assignment)):
+        changed = [
+            task_idx
+            for task_idx, worker_id in enumerate(neighbor.solution)
+            if worker_id != assignment[task_idx]
+        ]
+        # the changed tasks are distinct and none keeps its worker
+        assert 1 <= len(changed) <= max_changes
+        if max_changes == 1:
+            assert len(changed) == 1
+        assert all(0 <= worker_id < 4 for worker_id in neighbor.solution)